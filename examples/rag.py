@@ -32,9 +32,9 @@ docker run --rm \
 import contextlib
 import datetime
 import sqlite3
-import struct
 from collections.abc import Generator
 
+import numpy as np
 import sqlite_vec
 from openai import OpenAI
 from pydantic import BaseModel
@@ -106,25 +106,40 @@ class Journal:
         )
         embeddings = [embedding.embedding for embedding in response.data]
 
-        with self.cursor() as cursor:
-            for entry, embedding in zip(entries, embeddings, strict=False):
-                cursor.execute(
-                    "INSERT INTO entries (date, content) VALUES (?, ?)",
-                    (entry.date, entry.content),
-                )
-                entry_id = cursor.lastrowid
-
-                cursor.execute(
-                    "INSERT INTO vec_entries (id, embedding) VALUES (?, ?)",
-                    (entry_id, _serialize(embedding)),
-                )
-
-        self._db.commit()  # Don't forget to commit the changes
+        # Insert everything in a single transaction,
+        # assigning ids up front so both tables can be filled with `executemany`
+        with self._db, self.cursor() as cursor:
+            (last_id,) = cursor.execute(
+                "SELECT COALESCE(MAX(id), 0) FROM entries"
+            ).fetchone()
+            ids = range(last_id + 1, last_id + 1 + len(entries))
+
+            cursor.executemany(
+                "INSERT INTO entries (id, date, content) VALUES (?, ?, ?)",
+                [
+                    (entry_id, entry.date, entry.content)
+                    for entry_id, entry in zip(ids, entries, strict=True)
+                ],
+            )
+            cursor.executemany(
+                "INSERT INTO vec_entries (id, embedding) VALUES (?, ?)",
+                [
+                    (entry_id, _serialize(embedding))
+                    for entry_id, embedding in zip(ids, embeddings, strict=True)
+                ],
+            )
 
 
 def _serialize(vector: list[float]) -> bytes:
     """Serializes a list of floats into a compact "raw bytes" format"""
-    return struct.pack(f"{len(vector)}f", *vector)
+    # Let NumPy do the conversion in C
+    # rather than unpacking every element as an argument to `struct.pack`
+    return np.asarray(vector, dtype=np.float32).tobytes()
+
+
+def _one_line(text: str) -> str:
+    """Collapse line breaks, so text can't add lines to the search results."""
+    return " ".join(text.splitlines())
 
 
 ENTRIES = {
@@ -156,36 +171,48 @@ if __name__ == "__main__":
         db.add(entries)
 
         @hype.up
-        def search(query: str, top_k: int) -> list[Journal.Entry]:
+        def search(queries: list[str], top_k: int) -> str:
             """
-            Search for journal entries that match the query.
+            Search for journal entries that match one or more queries.
+            Pass related queries together to search for all of them at once.
+
+            :param queries: The search queries.
+            :param top_k: The number of entries to return for each query.
+            :return: A `# query: ...` line for each query,
+                     followed by its matching entries, most relevant first,
+                     as `date|content` lines (split each on its first `|`).
             """
 
+            # Embed every query with a single request
             response = client.embeddings.create(
-                input=[query], model="text-embedding-3-small"
+                input=queries, model="text-embedding-3-small"
             )
-            query_embedding = response.data[0].embedding
 
+            # State each query once above its entries instead of repeating it
+            # on every line, which keeps the tool output (and its tokens) compact
+            lines = []
             with db.cursor() as cursor:
-                results = cursor.execute(
-                    """
-                    SELECT
-                        entries.date,
-                        entries.content,
-                        distance
-                    FROM vec_entries
-                    LEFT JOIN entries ON entries.id = vec_entries.id
-                    WHERE embedding MATCH ?
-                        AND k = ?
-                    ORDER BY distance
-                    """,
-                    [_serialize(query_embedding), top_k],
-                ).fetchall()
-
-            return [
-                Journal.Entry(date=date, content=content)
-                for date, content, _ in results
-            ]
+                for query, embedding in zip(queries, response.data, strict=True):
+                    results = cursor.execute(
+                        """
+                        SELECT
+                            entries.date,
+                            entries.content,
+                            distance
+                        FROM vec_entries
+                        LEFT JOIN entries ON entries.id = vec_entries.id
+                        WHERE embedding MATCH ?
+                            AND k = ?
+                        ORDER BY distance
+                        """,
+                        [_serialize(embedding.embedding), top_k],
+                    ).fetchall()
+                    lines.append(f"# query: {_one_line(query)}")
+                    lines.extend(
+                        f"{date}|{_one_line(content)}" for date, content, _ in results
+                    )
+
+            return "\n".join(lines)
 
         tools = hype.create_openai_tools([search])
 
@@ -17,7 +17,6 @@ uv run examples/extract_tables.py
 # ]
 # ///
 
-import copy
 from collections.abc import Iterator
 from itertools import chain
 from typing import Annotated, Literal
@@ -27,6 +26,12 @@ from pydantic import Field, RootModel
 import hype
 
 DIGITS = set(range(1, 10))
+ALL_DIGITS = 0b111111111
+
+# Index of the 3×3 region containing each cell, looked up by `REGIONS[row][col]`
+REGIONS = tuple(
+    tuple(3 * (row // 3) + (col // 3) for col in range(9)) for row in range(9)
+)
 
 Status = Literal["solved", "incomplete", "invalid"]
 Digit = Annotated[int, Field(ge=1, le=9)]
@@ -43,15 +48,27 @@ class Sudoku(RootModel):
 
     @property
     def status(self) -> Status:
-        for collection in chain(self.rows, self.columns, self.regions):
-            digits = set()
-            for cell in collection:
-                if cell is None:
-                    return "incomplete"
-                digits.add(cell)
-            if digits != DIGITS:
+        # Walk the grid once, accumulating bitmasks of the digits
+        # present in each row, column, and region.
+        columns, regions = [0] * 9, [0] * 9
+        for i, row in enumerate(self.rows):
+            if None in row:
+                return "incomplete"
+            if len(row) != 9:
+                return "invalid"
+
+            mask = 0
+            for j, cell in enumerate(row):
+                bit = 1 << (cell - 1) if cell in DIGITS else 0
+                mask |= bit
+                columns[j] |= bit
+                regions[REGIONS[i][j]] |= bit
+            if mask != ALL_DIGITS:
                 return "invalid"
-        return "solved"
+
+        if all(mask == ALL_DIGITS for mask in chain(columns, regions)):
+            return "solved"
+        return "invalid"
 
     @classmethod
     def parse(cls, text: str) -> "Sudoku":
@@ -113,44 +130,66 @@ class Sudoku(RootModel):
 
 
 def solutions(puzzle: Sudoku) -> Iterator[Sudoku]:
-    match puzzle.status:
-        case "solved":
-            yield puzzle
-            return
-        case "incomplete":
-            pass
-        case "invalid":
-            return
-
-    rows = list(puzzle.rows)
-    columns = list(puzzle.columns)
-    regions = list(puzzle.regions)
-
-    possibilities: dict[Position, set[Digit]] = {}
+    # Track the digits present in each row, column, and region as bitmasks,
+    # where bit `d - 1` is set when digit `d` is present.
+    rows, columns, regions = [0] * 9, [0] * 9, [0] * 9
+    empty: set[Position] = set()
     for (row, col), val in puzzle:
         if val is None:
-            possibilities[(row, col)] = (
-                set(DIGITS)
-                - set(
-                    chain(
-                        rows[row],
-                        columns[col],
-                        regions[3 * (row // 3) + (col // 3)],
-                    )
-                )
-                - {None}
-            )
-    if not possibilities:
-        return
+            empty.add((row, col))
+            continue
+        if val not in DIGITS:
+            return
 
-    position, digits = min(
-        possibilities.items(),
-        key=lambda item: len(item[1]),
-    )
-    for digit in digits:
-        candidate = copy.deepcopy(puzzle)
-        candidate[position] = digit
-        yield from solutions(candidate)
+        bit = 1 << (val - 1)
+        region = REGIONS[row][col]
+        if (rows[row] | columns[col] | regions[region]) & bit:
+            return  # The same digit appears twice in a row, column, or region
+        rows[row] |= bit
+        columns[col] |= bit
+        regions[region] |= bit
+
+    def candidates(position: Position) -> int:
+        row, col = position
+        return ~(rows[row] | columns[col] | regions[REGIONS[row][col]]) & ALL_DIGITS
+
+    # Search a copy of the plain nested lists, rather than through the model,
+    # so the caller's puzzle isn't changed while the search is suspended
+    grid = [row[:] for row in puzzle.root]
+
+    def search() -> Iterator[Sudoku]:
+        if not empty:
+            # The grid is valid by construction, so skip revalidating it
+            yield Sudoku.model_construct(root=[list(row) for row in grid])
+            return
+
+        position = min(empty, key=lambda position: candidates(position).bit_count())
+        row, col = position
+        region = REGIONS[row][col]
+
+        # Search depth-first on a single grid, undoing each guess on backtrack
+        empty.remove(position)
+        remaining = candidates(position)
+        try:
+            while remaining:
+                bit = remaining & -remaining
+                remaining ^= bit
+
+                grid[row][col] = bit.bit_length()
+                rows[row] |= bit
+                columns[col] |= bit
+                regions[region] |= bit
+                try:
+                    yield from search()
+                finally:
+                    rows[row] ^= bit
+                    columns[col] ^= bit
+                    regions[region] ^= bit
+                    grid[row][col] = None
+        finally:
+            empty.add(position)
+
+    yield from search()
 
 
 @hype.up
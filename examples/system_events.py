@@ -21,6 +21,7 @@ uv run examples/system_events.py
 import datetime
 import os
 import subprocess
+import time
 from textwrap import dedent
 
 import ollama
@@ -29,18 +30,36 @@ import hype
 
 
 def _run_apple_script(
-    script: str, capture_output: bool = False
+    script: str, *args: str, capture_output: bool = False
 ) -> subprocess.CompletedProcess:
     """
     Private helper method to run AppleScript using launchctl.
 
     :param script: The AppleScript to run.
+    :param args: Arguments passed to the script's `run` handler.
     :param capture_output: Whether to capture the output of the script.
     :return: A CompletedProcess instance.
     """
     uid = os.getuid()
-    cmd = ["launchctl", "asuser", str(uid), "/usr/bin/osascript", "-e", script]
-    return subprocess.run(cmd, capture_output=capture_output, text=True, check=True)  # noqa: S603
+    # Pass the script on stdin rather than as an `-e` argument,
+    # so it isn't subject to argument length limits or shell-visible in `ps`
+    cmd = ["launchctl", "asuser", str(uid), "/usr/bin/osascript", "-", *args]
+    return subprocess.run(  # noqa: S603
+        cmd, input=script, capture_output=capture_output, text=True, check=True
+    )
+
+
+# Values are passed as arguments rather than interpolated into the source,
+# so the script text never changes and can't be broken by quotes in the input
+ADD_REMINDER_SCRIPT = dedent("""
+    on run {reminderTitle, reminderNotes, reminderDueDate}
+        tell application "Reminders"
+            set newReminder to make new reminder with properties {name:reminderTitle}
+            if reminderNotes is not "" then set body of newReminder to reminderNotes
+            if reminderDueDate is not "" then set due date of newReminder to date reminderDueDate
+        end tell
+    end run
+""").strip()
 
 
 # FIXME: Either Ollama doesn't seem to support multiple tool calls,
@@ -52,7 +71,7 @@ def get_current_time() -> float:
     Get the current time as a POSIX timestamp.
     """
 
-    return datetime.datetime.now().timestamp()
+    return time.time()
 
 
 @hype.up
@@ -71,15 +90,12 @@ def add_reminder(
     print(f"notes: {notes}")
     print(f"due_date: {due_date}")
 
-    apple_script = dedent(f"""
-        tell application "Reminders"
-            set newReminder to make new reminder with properties {{name:"{title}"}}
-            {f'set body of newReminder to "{notes}"' if notes else ''}
-            {f'set due date of newReminder to date "{due_date:%B %d, %Y at %I:%M:%S %p}"' if due_date else ''}
-        end tell
-    """).strip()
-
-    _run_apple_script(apple_script)
+    _run_apple_script(
+        ADD_REMINDER_SCRIPT,
+        title,
+        notes or "",
+        f"{due_date:%B %d, %Y at %I:%M:%S %p}" if due_date else "",
+    )
 
 
 if __name__ == "__main__":
@@ -13,21 +13,72 @@ uv run examples/tool_use.py
 # /// script
 # dependencies = [
 #   "anthropic",
+#   "sympy",
 #   "hype @ git+https://github.com/mattt/hype.git",
 # ]
 # ///
 
 import ast
+import functools
 import operator
 import re
 from collections.abc import Callable
 from typing import TypeVar
 
+from sympy import factorint, isprime
+
 import hype
 
 Number = TypeVar("Number", int, float)
 
 
+OPERATORS: dict[type, Callable] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+    ast.USub: operator.neg,
+}
+
+# Anything that isn't a digit, operator, decimal point, or parenthesis
+UNSUPPORTED_CHARACTERS = re.compile(r"[^0-9+\-*/().]")
+
+# A number, optionally followed by a single operator and another number,
+# which can be evaluated without parsing
+NUMBER = r"-?(?:\d+\.\d*|\.\d+|[1-9]\d*|0+)"
+SIMPLE_EXPRESSION = re.compile(rf"({NUMBER})(?:([+\-*/])({NUMBER}))?")
+SIMPLE_OPERATORS: dict[str, Callable] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
+
+
+def _evaluate_node(node: ast.AST) -> Number:
+    if isinstance(node, ast.Constant):
+        return node.value
+    elif isinstance(node, ast.UnaryOp):
+        return OPERATORS[type(node.op)](_evaluate_node(node.operand))
+    elif isinstance(node, ast.BinOp):
+        return OPERATORS[type(node.op)](
+            _evaluate_node(node.left), _evaluate_node(node.right)
+        )
+    else:
+        raise ValueError(f"Unsupported operation: {node}")
+
+
+def _number(literal: str) -> Number:
+    return float(literal) if "." in literal else int(literal)
+
+
+# Cache results by expression, so repeated expressions skip parsing and evaluation
+@functools.lru_cache(maxsize=1024)
+def _evaluate(expression: str) -> Number:
+    return _evaluate_node(ast.parse(expression, mode="eval").body)
+
+
 @hype.up
 def calculate(expression: str) -> Number:
     """
@@ -38,28 +89,13 @@ def calculate(expression: str) -> Number:
     :param expression: The mathematical expression to evaluate (e.g., '2 + 3 * 4').
     """
 
-    operators: dict[type, Callable] = {
-        ast.Add: operator.add,
-        ast.Sub: operator.sub,
-        ast.Mult: operator.mul,
-        ast.Div: operator.truediv,
-        ast.Pow: operator.pow,
-        ast.USub: operator.neg,
-    }
-
-    def evaluate(node: ast.AST) -> Number:
-        if isinstance(node, ast.Constant):
-            return node.value
-        elif isinstance(node, ast.UnaryOp):
-            return operators[type(node.op)](evaluate(node.operand))
-        elif isinstance(node, ast.BinOp):
-            return operators[type(node.op)](evaluate(node.left), evaluate(node.right))
-        else:
-            raise ValueError(f"Unsupported operation: {node}")
-
-    expression = re.sub(r"[^0-9+\-*/().]", "", expression)
-    tree = ast.parse(expression, mode="eval")
-    return evaluate(tree.body)
+    expression = UNSUPPORTED_CHARACTERS.sub("", expression)
+    if match := SIMPLE_EXPRESSION.fullmatch(expression):
+        left, symbol, right = match.groups()
+        if symbol is None:
+            return _number(left)
+        return SIMPLE_OPERATORS[symbol](_number(left), _number(right))
+    return _evaluate(expression)
 
 
 @hype.up
@@ -70,34 +106,55 @@ def prime_factors(n: int) -> list[int]:
     :param n: The number to factorize.
     :return: A list of prime factors.
     """
+    return list(_prime_factors(n))
+
+
+# Gaps between consecutive numbers coprime to 2 × 3 × 5 × 7 = 210, starting from 11
+# fmt: off
+WHEEL = (
+    2, 4, 2, 4, 6, 2, 6, 4, 2, 4, 6, 6, 2, 6, 4, 2, 6, 4, 6, 8, 4, 2, 4, 2,
+    4, 8, 6, 4, 6, 2, 4, 6, 2, 6, 6, 4, 2, 4, 6, 2, 6, 4, 2, 4, 2, 10, 2, 10,
+)
+# fmt: on
+
+
+# `@hype.up` can't wrap an `lru_cache` object directly,
+# so the cached implementation lives in a separate function
+@functools.lru_cache(maxsize=1024)
+def _prime_factors(n: int) -> tuple[int, ...]:
+    # Trial division is O(√n), so hand large numbers off to SymPy,
+    # which uses Pollard's rho and other sub-exponential methods
+    if n.bit_length() > 34:
+        return tuple(sorted(p for p in factorint(n) if p > 1))
+
     factors = set()
 
-    # Handle 2 and 3 separately
-    for p in (2, 3):
+    # Handle 2, 3, 5, and 7 separately
+    for p in (2, 3, 5, 7):
         while n % p == 0:
             factors.add(p)
             n //= p
 
-    # Use wheel factorization for remaining factors
-    # fmt: off
-    wheel = (
-        2, 4, 2, 4, 6, 2, 6, 4, 2, 4, 6, 6, 2, 6, 4, 2, 6, 4, 6, 8, 4, 2, 4, 2, 4, 8, # fmt: skip
-    )
-    # fmt: on
-    w, d = 0, 5
+    # Use wheel factorization for remaining factors,
+    # skipping every multiple of 2, 3, 5, and 7
+    w, d = 0, 11
 
-    while d * d <= n:
+    # Stop as soon as what's left is prime,
+    # rather than trial dividing all the way up to its square root
+    prime = isprime(n)
+    while not prime and d * d <= n:
         if n % d == 0:
             factors.add(d)
             n //= d
+            prime = isprime(n)
         else:
-            d += wheel[w]
-            w = (w + 1) % len(wheel)
+            d += WHEEL[w]
+            w = (w + 1) % len(WHEEL)
 
     if n > 1:
         factors.add(n)
 
-    return sorted(factors)
+    return tuple(sorted(factors))
 
 
 if __name__ == "__main__":
@@ -16,15 +16,21 @@ uv run examples/tool_use.py
 #   "hype @ git+https://github.com/mattt/hype.git",
 #   "duckduckgo-search",
 #   "beautifulsoup4",
+#   "lxml",
 #   "pydantic",
-#   "httpx",
+#   "httpx[http2]",
 #   "pint",
 # ]
 # ///
 
+import asyncio
+import atexit
 import datetime
+import functools
+import itertools
+import time
 from textwrap import dedent
-from typing import Literal
+from typing import Literal, get_args
 
 import anthropic
 import httpx
@@ -37,6 +43,20 @@ import hype
 
 ureg = pint.UnitRegistry()
 
+# Share one client across calls so connections (and TLS sessions) are reused
+http_client = httpx.Client(http2=True, timeout=30)
+atexit.register(http_client.close)
+
+# Only read the start of very large pages, to bound memory use and parsing time
+MAX_PAGE_SIZE = 2 * 1024 * 1024  # bytes
+
+search_client = DDGS()
+
+# Agents often repeat a search while working,
+# so keep recent results around for a few minutes
+SEARCH_CACHE_TTL = 300  # seconds
+_search_cache: dict[tuple[str, int], tuple[float, list[dict]]] = {}
+
 
 class Recipe(BaseModel):
     """
@@ -68,8 +88,22 @@ def web_search(query: str, num_results: int = 5) -> list[dict]:
     :param num_results: Number of results to return (default: 5).
     :return: A list of dictionaries containing search results.
     """
-    with DDGS() as ddgs:
-        return list(ddgs.text(query, max_results=num_results))
+    key = (query, num_results)
+    now = time.monotonic()
+    if (cached := _search_cache.get(key)) and now - cached[0] < SEARCH_CACHE_TTL:
+        # Copy the results, so changes to them don't affect the cache
+        return [dict(result) for result in cached[1]]
+
+    results = list(search_client.text(query, max_results=num_results))
+
+    # Drop expired entries so the cache doesn't grow without bound
+    for expired in [
+        k for k, (t, _) in _search_cache.items() if now - t >= SEARCH_CACHE_TTL
+    ]:
+        del _search_cache[expired]
+    _search_cache[key] = (now, results)
+
+    return [dict(result) for result in results]
 
 
 @hype.up
@@ -80,10 +114,58 @@ def scrape_webpage(url: str) -> str:
     :param url: The URL of the webpage to scrape.
     :return: The text content of the webpage.
     """
-    with httpx.Client() as client:  # pylint: disable=redefined-outer-name
-        response = client.get(url, timeout=30)  # pylint: disable=redefined-outer-name
-        soup = BeautifulSoup(response.content, "html.parser")
-        return soup.get_text(strip=True)
+    with http_client.stream("GET", url) as response:  # pylint: disable=redefined-outer-name
+        response.raise_for_status()
+        content = bytearray()
+        for chunk in response.iter_bytes():
+            content += chunk
+            if len(content) >= MAX_PAGE_SIZE:
+                break
+    return _extract_text(bytes(content[:MAX_PAGE_SIZE]))
+
+
+@hype.up
+def scrape_webpages(urls: list[str]) -> list[str]:
+    """
+    Scrape the content of several webpages at once.
+    Prefer this to calling `scrape_webpage` repeatedly.
+
+    :param urls: The URLs of the webpages to scrape.
+    :return: The text content of each webpage, in the same order as the URLs,
+             or an error message for each webpage that couldn't be scraped.
+    """
+
+    async def scrape(client: httpx.AsyncClient, url: str) -> str:
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+            content = bytearray()
+            async for chunk in response.aiter_bytes():
+                content += chunk
+                if len(content) >= MAX_PAGE_SIZE:
+                    break
+        return _extract_text(bytes(content[:MAX_PAGE_SIZE]))
+
+    async def scrape_all() -> list[str]:
+        # Fetch every page concurrently, so the total wait is the slowest response
+        async with httpx.AsyncClient(http2=True, timeout=30) as client:
+            results = await asyncio.gather(
+                *(scrape(client, url) for url in urls), return_exceptions=True
+            )
+
+        # Report failures per page, so one bad URL doesn't lose the others
+        return [
+            f"An error occurred while scraping {url}: {result}"
+            if isinstance(result, Exception)
+            else result
+            for url, result in zip(urls, results, strict=True)
+        ]
+
+    return asyncio.run(scrape_all())
+
+
+def _extract_text(content: bytes) -> str:
+    soup = BeautifulSoup(content, "lxml")
+    return soup.get_text(strip=True)
 
 
 # fmt:off
@@ -98,6 +180,27 @@ Unit = Literal[
 # fmt:on
 
 
+def _conversion_factors() -> dict[tuple[str, str], tuple[float, str]]:
+    """
+    Compute the factor and resulting unit name for every convertible pair of units.
+
+    Temperatures are left out, because converting them
+    requires an offset and not just a factor.
+    """
+    factors = {}
+    units = [unit for unit in get_args(Unit) if unit not in {"°C", "°F"}]
+    for from_unit, to_unit in itertools.product(units, repeat=2):
+        try:
+            converted = ureg.Quantity(1, from_unit).to(to_unit)
+        except pint.DimensionalityError:
+            continue
+        factors[(from_unit, to_unit)] = (converted.magnitude, str(converted.units))
+    return factors
+
+
+CONVERSION_FACTORS = _conversion_factors()
+
+
 @hype.up
 def convert_quantity(value: float, from_unit: Unit, to_unit: Unit) -> tuple[float, str]:
     """
@@ -108,15 +211,24 @@ def convert_quantity(value: float, from_unit: Unit, to_unit: Unit) -> tuple[floa
     :param to_unit: The unit to convert to.
     :return: A tuple with the converted value and unit.
     """
-    quantity = value * ureg(from_unit)
-    converted = quantity.to(to_unit)
+    if conversion := CONVERSION_FACTORS.get((from_unit, to_unit)):
+        factor, units = conversion
+        return value * factor, units
+
+    quantity = ureg.Quantity(value, _parse_units(from_unit))
+    converted = quantity.to(_parse_units(to_unit))
     return converted.magnitude, str(converted.units)
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_units(unit: str) -> pint.Unit:
+    return ureg.parse_units(unit)
+
+
 if __name__ == "__main__":
     client = anthropic.Anthropic()
     tools = hype.create_anthropic_tools(
-        [web_search, scrape_webpage, convert_quantity],
+        [web_search, scrape_webpage, scrape_webpages, convert_quantity],
         result_type=Recipe,
     )
 
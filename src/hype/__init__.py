@@ -1,10 +1,14 @@
-from hype.function import Function
-from hype.function import wrap as up
-from hype.gui import create_gradio_interface
-from hype.http import create_fastapi_app
-from hype.tools.anthropic import create_anthropic_tools
-from hype.tools.ollama import create_ollama_tools
-from hype.tools.openai import create_openai_tools
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from hype.function import Function
+    from hype.function import wrap as up
+    from hype.gui import create_gradio_interface
+    from hype.http import create_fastapi_app
+    from hype.tools.anthropic import create_anthropic_tools
+    from hype.tools.ollama import create_ollama_tools
+    from hype.tools.openai import create_openai_tools
 
 __all__ = [
     "up",
@@ -15,3 +19,30 @@ __all__ = [
     "create_ollama_tools",
     "create_gradio_interface",
 ]
+
+# Everything is imported on first access,
+# so that `import hype` doesn't pull in pydantic, FastAPI, and friends
+# (the CLI can list a module's functions without them)
+_LAZY_IMPORTS = {
+    "up": ("hype.function", "wrap"),
+    "Function": ("hype.function", "Function"),
+    "create_fastapi_app": ("hype.http", "create_fastapi_app"),
+    "create_anthropic_tools": ("hype.tools.anthropic", "create_anthropic_tools"),
+    "create_openai_tools": ("hype.tools.openai", "create_openai_tools"),
+    "create_ollama_tools": ("hype.tools.ollama", "create_ollama_tools"),
+    "create_gradio_interface": ("hype.gui", "create_gradio_interface"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if target := _LAZY_IMPORTS.get(name):
+        module, attr = target
+        value = getattr(importlib.import_module(module), attr)
+        # Cache the value, so later lookups don't go through `__getattr__`
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
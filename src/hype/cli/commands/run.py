@@ -1,18 +1,63 @@
 import json
+import math
+import mmap
 import os
-import sys
+import re
 import textwrap
-from collections.abc import Iterator
-from datetime import datetime, timezone
-from difflib import get_close_matches
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
+from click.utils import make_default_short_help
+
+from hype.cli.utils import (
+    add_module_dir_to_path,
+    find_function_by_name,
+    load_functions,
+    load_module,
+    read_function_index,
+    write_function_index,
+)
+
+# Functions and jobs are imported when a command runs,
+# so that listing functions doesn't pay for importing pydantic
+if TYPE_CHECKING:
+    from hype import Function
+    from hype.job import Batch, Job
+
+# Parse input and serialize jobs with orjson when it's installed
+# (its decode errors subclass json.JSONDecodeError)
+try:
+    from orjson import OPT_UTC_Z
+    from orjson import dumps as orjson_dumps
+    from orjson import loads as json_loads
+
+    # orjson can parse a memory-mapped file in place
+    _MMAP_INPUT_MIN_SIZE: int | None = 64 * 1024
+except ImportError:
+    from json import loads as json_loads
+
+    orjson_dumps = None
+    _MMAP_INPUT_MIN_SIZE = None
 
-from hype import Function
-from hype.cli.utils import find_functions, import_module_from_path
-from hype.job import Batch, Error, Job, Status
+# Click parameter types for JSON Schema types (anything else is a string),
+# using Click's shared instances rather than having each option wrap a Python type
+PARAM_TYPES = {"integer": click.INT, "number": click.FLOAT, "boolean": click.BOOL}
+
+# Matches the first non-whitespace byte, to check for empty input without copying it
+_NON_WHITESPACE = re.compile(rb"\S")
+
+# Options created for each function, keyed by the function's id
+# and whether its required parameters are enforced.
+# Entries hold a reference to the function, so its id isn't reused.
+_options_cache: dict[tuple[int, bool], tuple["Function", list[click.Option]]] = {}
 
 
 class FunctionCommand(click.Command):
@@ -20,137 +65,133 @@ class FunctionCommand(click.Command):
 
     # Class-level constant (no self needed)
     BUILT_IN_OPTIONS = frozenset(["input", "output", "help"])
+    INPUT_OPTION_STRINGS = frozenset(["--input", "-i"])
+    OUTPUT_OPTION_STRINGS = frozenset(["--output", "-o"])
 
-    def __init__(self, function: Function, module_path: str, **kwargs: Any) -> None:
+    def __init__(self, function: "Function", module_path: str, **kwargs: Any) -> None:
         self.function = function
         self.input_file = kwargs.pop("input_file", None)
         self.output_file = kwargs.pop("output_file", None)
+        # None unless --concurrency was given, which only applies to batches
+        self.concurrency: int | None = kwargs.pop("concurrency", None)
+        self.raw = kwargs.pop("raw", False)
         self.module_path = module_path
 
+        # Read the wall clock once, and time jobs relative to it
+        # (re-anchored each time the command is invoked)
+        self._started_at = datetime.now(timezone.utc)
+        self._started_at_ns = time.monotonic_ns()
+
         help_text = function.description or ""
 
         super().__init__(
             name=function.name, help=help_text, callback=self.invoke, **kwargs
         )
 
+        # Get function-specific parameters as options
+        # (when using --input, all parameters should be optional)
+        key = (id(function), not self.input_file)
+        if (cached := _options_cache.get(key)) is None:
+            cached = (function, self._create_options(function, required=key[1]))
+            _options_cache[key] = cached
+        self.function_params = cached[1]
+
         # Add built-in options first
-        self.params.append(
-            click.Option(
-                ["--input", "-i"],
-                type=click.Path(exists=True, readable=True),
-                required=False,
-                help="Read input from a JSON or JSON Lines file",
-                is_flag=False,
-            )
+        self.params.extend(
+            [
+                click.Option(
+                    ["--input", "-i"],
+                    type=click.Path(exists=True, readable=True),
+                    required=False,
+                    help="Read input from a JSON or JSON Lines file",
+                    is_flag=False,
+                ),
+                click.Option(
+                    ["--output", "-o"],
+                    type=click.Path(writable=True),
+                    required=False,
+                    help="Write output to a JSON or JSON Lines file",
+                    is_flag=False,
+                ),
+                *self.function_params,
+            ]
         )
-        self.params.append(
-            click.Option(
-                ["--output", "-o"],
-                type=click.Path(writable=True),
-                required=False,
-                help="Write output to a JSON or JSON Lines file",
-                is_flag=False,
-            )
-        )
-
-        # Add function-specific parameters as options
-        schema = function.input_schema
-        required_params = schema.get("required", [])
-        for name, prop in schema.get("properties", {}).items():
-            # When using --input, all parameters should be optional
-            self._append_option(
-                name, prop, required=(name in required_params and not self.input_file)
-            )
 
-    def _append_option(self, name: str, prop: dict, required: bool) -> None:
-        """Add a click Option to the command's parameters.
+    def _create_options(
+        self, function: "Function", required: bool
+    ) -> list[click.Option]:
+        """Create click Options for a function's parameters.
 
         Args:
-            name: Parameter name
-            prop: Parameter properties from the schema
-            required: Whether the parameter is required
+            function: The function
+            required: Whether the function's required parameters are enforced
         """
-        param_type = self._get_param_type(prop)
-        self.params.append(
+        schema = function.input_schema
+        required_params = frozenset(schema.get("required") or ())
+        return [
             click.Option(
-                ["--" + name],
-                type=param_type,
-                required=required,
+                ("--" + name,),
+                type=PARAM_TYPES.get(prop.get("type"), click.STRING),
+                required=(required and name in required_params),
                 is_flag=False,
                 help=prop.get("description"),
                 default=prop.get("default"),
             )
-        )
-
-    def _get_param_type(self, prop: dict) -> Any:
-        """Helper method to determine parameter type."""
-        param_type = str
-        if prop.get("type") == "integer":
-            param_type = int
-        elif prop.get("type") == "number":
-            param_type = float
-        elif prop.get("type") == "boolean":
-            param_type = bool
-        return param_type
+            for name, prop in (schema.get("properties") or {}).items()
+        ]
 
     def parse_args(
         self, ctx: click.Context, args: list[str]
     ) -> tuple[list[str], list[str], list[str]]:
         """Override to handle positional arguments for required parameters."""
 
-        def extract_option_pairs(
-            args: list[str], allowed_options: set[str]
-        ) -> list[str]:
-            """Extract option-value pairs for specified options."""
-            result = []
-            for i, arg in enumerate(args):
-                if arg in allowed_options and i + 1 < len(args):
-                    result.extend([arg, args[i + 1]])
-            return result
-
-        # Check for --input and validate arguments
-        if "--input" in args or "-i" in args:
-            return super().parse_args(
-                ctx, extract_option_pairs(args, {"--input", "-i"} | {"--output", "-o"})
-            )
-
-        # Handle the -- separator for command arguments
-        if "--" in args:
-            idx = args.index("--")
-            args = (
-                args[:idx] + [" ".join(args[idx + 1 :])]
-                if args[idx + 1 :]
-                else args[:idx]
-            )
-
         # Get function parameters (excluding built-in options)
-        function_params = [
-            param for param in self.params if param.name not in self.BUILT_IN_OPTIONS
-        ]
+        function_params = self.function_params
 
-        # Split args into positional and named arguments
+        # Split args into positional, named, and built-in arguments in a single pass
+        has_input = False
+        built_in_pairs = []
         positional = []
         named = []
-        args_iter = iter(enumerate(args))
-
-        for i, arg in args_iter:
-            if arg.startswith("--"):
-                if i + 1 >= len(args):
-                    raise click.UsageError(f"Option {arg} requires an argument")
-                named.extend([arg, args[i + 1]])
-                next(args_iter, None)  # Skip the next item since we consumed it
-            else:
+        used_params = set()
+        args_iter = iter(args)
+
+        for arg in args_iter:
+            if arg == "--":
+                # Handle the -- separator for command arguments
+                if rest := list(args_iter):
+                    positional.append(" ".join(rest))
+                break
+
+            is_built_in = (
+                arg in self.INPUT_OPTION_STRINGS or arg in self.OUTPUT_OPTION_STRINGS
+            )
+            if not is_built_in and not arg.startswith("--"):
                 positional.append(arg)
+                continue
 
-        # Validate for duplicate parameters
-        used_params = set()
-        for i in range(0, len(named), 2):
-            param_name = named[i][2:]  # Remove '--' prefix
+            # Consume the option's value from the same iterator
+            value = next(args_iter, None)
+            if value is None:
+                raise click.UsageError(f"Option {arg} requires an argument")
+
+            if is_built_in:
+                has_input = has_input or arg in self.INPUT_OPTION_STRINGS
+                built_in_pairs.extend([arg, value])
+                continue
+
+            # Validate for duplicate parameters
+            param_name = arg[2:]  # Remove '--' prefix
             if param_name in used_params:
                 raise click.UsageError(
                     f"Got multiple values for argument '{param_name}'"
                 )
             used_params.add(param_name)
+            named.extend([arg, value])
+
+        # When reading from --input, only the built-in options apply
+        if has_input:
+            return super().parse_args(ctx, built_in_pairs)
 
         # Validate number of positional arguments
         if len(positional) > len(function_params):
@@ -167,152 +208,281 @@ class FunctionCommand(click.Command):
             used_params.add(param.name)
 
         # Include output option if present
-        if "--output" in args or "-o" in args:
-            named.extend(extract_option_pairs(args, {"--output", "-o"}))
+        named.extend(built_in_pairs)
 
         return super().parse_args(ctx, named)
 
     def _read_input(self, file: str) -> dict | None:
         """Read input from a JSON file."""
         path = Path(file)
-        with path.open(encoding="utf-8") as f:
-            content = f.read().strip()
-            if not content:
-                raise click.ClickException("Input file is empty")
-
+        with path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
             try:
-                data = json.loads(content)
-                return data
+                if _MMAP_INPUT_MIN_SIZE is not None and size >= _MMAP_INPUT_MIN_SIZE:
+                    # Parse large files without reading them into memory first
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if _NON_WHITESPACE.search(mm) is None:
+                            raise click.ClickException("Input file is empty")
+                        with memoryview(mm) as view:
+                            return json_loads(view)
+
+                content = f.read().strip()
+                if not content:
+                    raise click.ClickException("Input file is empty")
+                return json_loads(content)
             except json.JSONDecodeError as e:
                 raise click.ClickException(f"Invalid JSON in input file: {e}") from e
 
     def _read_batch_inputs(self, file: str) -> Iterator[dict]:
         """Read inputs from a JSON Lines file."""
         path = Path(file)
-        with path.open(encoding="utf-8") as f:
+        with path.open("rb") as f:
             for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if line:  # Skip empty lines
-                    try:
-                        yield json.loads(line)
-                    except json.JSONDecodeError as e:
-                        raise click.ClickException(
-                            f"Invalid JSON on line {line_num}: {e}"
-                        ) from e
-
-    def _apply_defaults(self, input_data: dict | None = None) -> dict:
-        """Apply defaults to function parameters."""
-        defaults = {
+                # Skip empty lines
+                # (the parser ignores surrounding whitespace, so don't strip)
+                if line.isspace():
+                    continue
+                try:
+                    yield json_loads(line)
+                except json.JSONDecodeError as e:
+                    raise click.ClickException(
+                        f"Invalid JSON on line {line_num}: {e}"
+                    ) from e
+
+    @cached_property
+    def defaults(self) -> dict:
+        """Default values of the function's parameters."""
+        return {
             name: prop.get("default")
             for name, prop in self.function.input_schema.get("properties", {}).items()
             if "default" in prop
         }
+
+    def _apply_defaults(self, input_data: dict | None = None) -> dict:
+        """Apply defaults to function parameters."""
+        defaults = dict(self.defaults)
         if input_data:
             defaults.update(input_data)
         return defaults
 
     def invoke(self, ctx: click.Context) -> None:
         """Execute the wrapped function with provided arguments."""
+        from hype.job import (  # pylint: disable=import-outside-toplevel
+            Batch,
+            Job,
+            Status,
+        )
+
         input_file = ctx.params.pop("input", None) or self.input_file
         output_file = ctx.params.pop("output", None) or self.output_file
 
-        if input_file and input_file.endswith(".jsonl"):
+        self._started_at = datetime.now(timezone.utc)
+        self._started_at_ns = time.monotonic_ns()
+
+        is_batch = bool(input_file) and input_file.endswith(".jsonl")
+        if self.concurrency is not None and not is_batch:
+            raise click.UsageError(
+                "--concurrency only applies to JSON Lines (.jsonl) input"
+            )
+
+        if is_batch:
             # Read batch of inputs from a JSON Lines file
-            jobs = [Job(input=input) for input in self._read_batch_inputs(input_file)]
+            jobs = (
+                Job(input=input, created_at=self._now())
+                for input in self._read_batch_inputs(input_file)
+            )
+
+            if output_file and output_file.endswith(".jsonl"):
+                # Write each job as soon as it's done,
+                # instead of holding the whole batch in memory
+                with (
+                    click.open_file(output_file, "wb") as f,
+                    click.progressbar(
+                        self._execute_batch(jobs), label="Processing batch"
+                    ) as bar,
+                ):
+                    for job in bar:
+                        f.write(self._dump(job))
+                        f.write(b"\n")
+                return
 
             # Add a progress bar for batch processing
+            jobs = list(jobs)
             with click.progressbar(
-                jobs, label="Processing batch", length=len(jobs)
+                self._execute_batch(jobs), label="Processing batch", length=len(jobs)
             ) as bar:
-                for job in bar:
-                    try:
-                        self._execute(job)
-                    except Exception as e:
-                        click.echo(f"Error processing job: {e}", err=True)
+                for _ in bar:
+                    pass
 
             batch = Batch(jobs=jobs)
             self._write_batch_output(batch, output_file)
         else:
             # Process single input from a JSON file or CLI arguments
             input = self._read_input(input_file) if input_file else ctx.params
-            job = Job(input=self._apply_defaults(input))
+            job = Job(input=self._apply_defaults(input), created_at=self._now())
             self._execute(job)
             self._write_job_output(job, output_file)
 
             if job.status == Status.FAILURE:
                 raise click.ClickException(job.error.message)
 
-    def _execute(self, job: Job) -> Job:
+    def _execute_batch(self, jobs: Iterable["Job"]) -> Iterator["Job"]:
+        """Execute batch jobs, yielding each one in order once it's done.
+
+        With a concurrency greater than 1, jobs run in a thread pool,
+        which helps most when the function waits on I/O.
+        """
+        concurrency = self.concurrency or 1
+        if concurrency == 1:
+            for job in jobs:
+                self._execute_batch_job(job)
+                yield job
+            return
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # Limit how many jobs are in flight,
+            # so that inputs are still read as they're needed
+            pending: deque[tuple[Job, Future]] = deque()
+            for job in jobs:
+                pending.append((job, executor.submit(self._execute_batch_job, job)))
+                if len(pending) >= 2 * concurrency:
+                    done, future = pending.popleft()
+                    future.result()
+                    yield done
+            while pending:
+                done, future = pending.popleft()
+                future.result()
+                yield done
+
+    def _execute_batch_job(self, job: "Job") -> None:
         try:
-            job.started_at = datetime.now(timezone.utc)
+            self._execute(job)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            click.echo(f"Error processing job: {e}", err=True)
+
+    def _execute(self, job: "Job") -> "Job":
+        from hype.job import Error  # pylint: disable=import-outside-toplevel
+
+        try:
+            job.started_at = self._now()
             job.output = self.function(**job.input)
         except Exception as e:  # pylint: disable=broad-exception-caught
             job.error = Error(message=str(e))
         finally:
-            job.completed_at = datetime.now(timezone.utc)
+            job.completed_at = self._now()
         return job
 
+    def _now(self) -> datetime:
+        """Get the current time from the monotonic clock."""
+        elapsed = time.monotonic_ns() - self._started_at_ns
+        return self._started_at + timedelta(microseconds=elapsed // 1000)
+
     def _write_batch_output(
-        self, batch: Batch[dict, Any], output_file: str | None
+        self, batch: "Batch[dict, Any]", output_file: str | None
     ) -> None:
         """Write batch results to output file or stdout."""
         if output_file:
-            with click.open_file(output_file, "w", encoding="utf-8") as f:
-                if output_file.endswith(".jsonl"):
-                    for job in batch.jobs:
-                        f.write(json.dumps(job.model_dump(), default=str) + "\n")
-                else:
-                    outputs = [job.model_dump() for job in batch.jobs]
-                    f.write(json.dumps(outputs, default=str) + "\n")
+            # JSON Lines output is streamed by `invoke`,
+            # so this writes a JSON array
+            with click.open_file(output_file, "wb") as f:
+                # Write jobs one at a time
+                # instead of building the whole array in memory
+                f.write(b"[")
+                for i, job in enumerate(batch.jobs):
+                    if i:
+                        f.write(b",")
+                    f.write(self._dump(job))
+                f.write(b"]\n")
         else:
-            for job in batch.jobs:
-                self._write_job_output_to_stdout(job)
+            from hype.job import Status  # pylint: disable=import-outside-toplevel
 
-    def _write_job_output(self, job: Job[dict, Any], output_file: str | None) -> None:
+            # Collect output into chunks of about 64 KiB,
+            # rather than writing (and flushing) once per job
+            chunk: list[str] = []
+            size = 0
+            for job in batch.jobs:
+                if chunk and (job.status != Status.SUCCESS or job.output is None):
+                    # This job reports to stderr, so write earlier results first
+                    # to keep them in order
+                    click.echo("\n".join(chunk))
+                    chunk.clear()
+                    size = 0
+                text = self._format_job_output(job)
+                if text is None:
+                    continue
+                chunk.append(text)
+                size += len(text)
+                if size >= 65536:
+                    click.echo("\n".join(chunk))
+                    chunk.clear()
+                    size = 0
+            if chunk:
+                click.echo("\n".join(chunk))
+
+    def _write_job_output(self, job: "Job[dict, Any]", output_file: str | None) -> None:
         """Write single job result to output file or stdout."""
         if output_file:
-            with click.open_file(output_file, "w", encoding="utf-8") as f:
-                f.write(json.dumps(job.model_dump(), default=str) + "\n")
+            with click.open_file(output_file, "wb") as f:
+                f.write(self._dump(job))
+                f.write(b"\n")
         else:
             self._write_job_output_to_stdout(job)
 
-    def _write_job_output_to_stdout(self, job: Job[dict, Any]) -> None:
+    def _dump(self, job: "Job[dict, Any]") -> bytes:
+        """Serialize a job (or just its output, if raw) for an output file.
+
+        Output files are written as bytes, so that serialized jobs
+        don't have to be decoded and then encoded again.
+        """
+        return _dump_output(job) if self.raw else _dump_job(job)
+
+    def _write_job_output_to_stdout(self, job: "Job[dict, Any]") -> None:
         """Write job output to stdout."""
+        text = self._format_job_output(job)
+        if text is not None:
+            click.echo(text)
+
+    def _format_job_output(self, job: "Job[dict, Any]") -> str | None:
+        """Format job output for stdout, reporting errors to stderr."""
+        from hype.job import Status  # pylint: disable=import-outside-toplevel
 
         if job.status == Status.SUCCESS:
             output = job.output
             if output is None:
                 click.echo("No output", err=True)
-            elif isinstance(output, dict | list):
-                click.echo(json.dumps(output, default=str))
-            else:
-                click.echo(output)
-        else:
-            click.echo(f"Error: {job.error.message}", err=True)
-
-    def format_usage(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
-        """Format the usage line."""
+                return None
+            if isinstance(output, dict | list):
+                return _dump_value(output).decode()
+            if (
+                model_dump_json := getattr(output, "model_dump_json", None)
+            ) is not None:
+                # Pydantic models serialize themselves
+                return model_dump_json()
+            return str(output)
+
+        click.echo(f"Error: {job.error.message}", err=True)
+        return None
+
+    @cached_property
+    def usage(self) -> str:
+        """The usage line, which only depends on the command's parameters."""
 
         # Build the full command path including the complete module path
         command_path = f"hype run {self.module_path} {self.name}"
         prefix = f"Usage: {command_path} "
-        formatter.write(prefix)
 
-        # Write the options section
-        formatter.write("[options...]")
+        lines = [prefix + "[options...]"]
+        for param in self.function_params:
+            chunk = f"(<{param.name}> | --{param.name} VALUE)"
+            if not param.required:
+                chunk = f"[{chunk}]"
+            lines.append(" " * len(prefix) + chunk)
 
-        # Get required parameters
-        if parameters := [
-            param for param in self.params if param.name not in self.BUILT_IN_OPTIONS
-        ]:
-            for param in parameters:
-                formatter.write(" \\ \n")
-                chunk = f"(<{param.name}> | --{param.name} VALUE)"
-                if not param.required:
-                    chunk = f"[{chunk}]"
-                formatter.write(" " * len(prefix) + chunk)
+        return " \\ \n".join(lines) + "\n"
 
-        formatter.write("\n")
+    def format_usage(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """Format the usage line."""
+        formatter.write(self.usage)
 
     def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
         """Custom help formatter to improve the layout."""
@@ -332,14 +502,13 @@ class FunctionCommand(click.Command):
         self, ctx: click.Context, formatter: click.HelpFormatter
     ) -> None:
         """Format the options sections."""
-        built_in_opts = []
-        function_opts = []
-
-        for param in self.get_params(ctx):
-            if param.name in self.BUILT_IN_OPTIONS:
-                built_in_opts.append(param)
-            else:
-                function_opts.append(param)
+        function_opts = self.function_params
+        # The help option is created per context, so look up built-ins each time
+        built_in_opts = [
+            param
+            for param in self.get_params(ctx)
+            if param.name in self.BUILT_IN_OPTIONS
+        ]
 
         if function_opts:
             with formatter.section("Parameters"):
@@ -360,6 +529,164 @@ class FunctionCommand(click.Command):
                         formatter.write_dl([param.get_help_record(ctx)])
 
 
+def _dump_job(job: "Job[dict, Any]") -> bytes:
+    """Serialize a job to UTF-8 encoded JSON.
+
+    With orjson, the job's fields are serialized directly.
+    Otherwise (or if orjson can't serialize the job) uses pydantic's serializer,
+    falling back to converting anything it can't serialize to a string.
+    """
+    if orjson_dumps is not None:
+        try:
+            return orjson_dumps(
+                _job_to_dict(job), default=_model_to_json, option=OPT_UTC_Z
+            )
+        except TypeError:  # Includes orjson.JSONEncodeError
+            pass
+
+    from pydantic_core import (  # pylint: disable=import-outside-toplevel
+        PydanticSerializationError,
+        to_json,
+    )
+
+    try:
+        return to_json(job)
+    except PydanticSerializationError:
+        return json.dumps(
+            job.model_dump(),
+            default=_json_default,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode()
+
+
+def _job_to_dict(job: "Job[dict, Any]") -> dict[str, Any]:
+    """Get a job's fields, in the same shape as `job.model_dump()`.
+
+    Job has a small, fixed set of fields, so building the dict directly
+    avoids walking them through pydantic.
+    """
+    return {
+        "id": job.id,
+        "input": job.input,
+        "output": job.output,
+        "error": None if job.error is None else {"message": job.error.message},
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "completed_at": job.completed_at,
+        "canceled_at": job.canceled_at,
+        "status": job.status,
+    }
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert datetimes to ISO 8601 strings like pydantic and orjson do,
+    and anything else json can't serialize to a string.
+    """
+    if isinstance(obj, datetime):
+        text = obj.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    return str(obj)
+
+
+def _model_to_json(obj: Any) -> Any:
+    """Convert pydantic models for orjson, which doesn't support them."""
+    if (model_dump := getattr(obj, "model_dump", None)) is not None:
+        return model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dump_output(job: "Job[dict, Any]") -> bytes:
+    """Serialize a job's output to UTF-8 encoded JSON, without the rest of the job.
+
+    Failed jobs have no output, so they're written as `null`.
+    """
+    output = job.output
+    if (model_dump_json := getattr(output, "model_dump_json", None)) is not None:
+        return model_dump_json().encode()
+    return _dump_value(output)
+
+
+def _dump_value(value: Any) -> bytes:
+    """Serialize a value to UTF-8 encoded JSON.
+
+    Uses orjson if it's installed, or else json.
+    Pydantic models are converted to dicts,
+    and anything else that can't be serialized is converted to a string.
+    """
+    if orjson_dumps is not None:
+        try:
+            return orjson_dumps(value, default=_model_or_str, option=OPT_UTC_Z)
+        except TypeError:  # Includes orjson.JSONEncodeError
+            pass
+
+    # Write the same JSON as orjson, so output doesn't depend on whether it's installed:
+    # compact, UTF-8 rather than \u escapes, ISO 8601 datetimes, and NaN as null
+    try:
+        text = json.dumps(
+            value,
+            default=_model_or_str,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        )
+    except ValueError:
+        text = json.dumps(
+            _finite(value),
+            default=lambda obj: _finite(_model_or_str(obj)),
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+    return text.encode()
+
+
+def _model_or_str(obj: Any) -> Any:
+    """Convert pydantic models to dicts, datetimes to ISO 8601 strings,
+    and anything else to a string.
+    """
+    try:
+        return _model_to_json(obj)
+    except TypeError:
+        return _json_default(obj)
+
+
+def _finite(value: Any) -> Any:
+    """Replace NaN and infinite floats with None, as orjson does."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_finite(item) for item in value]
+    return value
+
+
+def _close_matches(word: str, possibilities: list[str]) -> list[str]:
+    """Find up to three names similar to a misspelled one.
+
+    Uses rapidfuzz if it's installed, or else difflib.
+    """
+    try:
+        from rapidfuzz import (  # pylint: disable=import-outside-toplevel
+            fuzz,
+            process,
+        )
+    except ImportError:
+        from difflib import (  # pylint: disable=import-outside-toplevel
+            get_close_matches,
+        )
+
+        return get_close_matches(word, possibilities, n=3, cutoff=0.6)
+
+    # `fuzz.ratio` is scaled to 0-100, but otherwise comparable to difflib's ratio
+    return [
+        match
+        for match, _, _ in process.extract(
+            word, possibilities, scorer=fuzz.ratio, limit=3, score_cutoff=60
+        )
+    ]
+
+
 class ModuleGroup(click.Group):
     """Custom group class that loads commands from a module."""
 
@@ -368,6 +695,8 @@ class ModuleGroup(click.Group):
         module_path: str,
         input_file: str | None = None,
         output_file: str | None = None,
+        concurrency: int | None = None,
+        raw: bool = False,
         **kwargs: Any,
     ) -> None:
         # Store full module path
@@ -378,36 +707,65 @@ class ModuleGroup(click.Group):
         self.module_path = module_path
         self.input_file = input_file
         self.output_file = output_file
+        self.concurrency = concurrency
+        self.raw = raw
         self._loaded = False
-        self._functions: list[Function] = []
-
-    def _load_commands(self) -> None:
-        """Lazy load commands from the module."""
+        self._lock = threading.Lock()
+        self._module: Any = None
+        self._functions: dict[str, "Function"] = {}
+        # Names and descriptions of the module's functions, sorted by name
+        self._index: dict[str, str | None] | None = None
+
+    def _load_module(self) -> Any:
+        """Lazy load the module."""
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = load_module(self.module_path)
+        return self._module
+
+    def _load_functions(self) -> None:
+        """Lazy load functions from the module."""
         if self._loaded:
             return
-        module = import_module_from_path(self.module_path)
-        self._functions = find_functions(module)
-        for function in self._functions:
-            self.add_command(
-                FunctionCommand(
-                    function,
-                    module_path=self.module_path,
-                    output_file=self.output_file,
-                    input_file=self.input_file,
-                )
-            )
-        self._loaded = True
+        with self._lock:
+            if self._loaded:
+                return
+            self._functions = {
+                function.name: function for function in load_functions(self.module_path)
+            }
+            self._index = {
+                name: self._functions[name].description
+                for name in sorted(self._functions)
+            }
+            write_function_index(self.module_path, self._functions.values())
+            self._loaded = True
 
     def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
-        self._load_commands()
         cmd = super().get_command(ctx, cmd_name)
-        if cmd is None and self._functions:
-            # Get list of available function names
-            available_commands = list(self.commands.keys())
-            # Find similar commands using difflib
-            suggestions = get_close_matches(
-                cmd_name, available_commands, n=3, cutoff=0.6
+        if cmd is not None:
+            return cmd
+
+        # Look the function up by name before finding all of them
+        function = find_function_by_name(self._load_module(), cmd_name)
+        if function is None:
+            self._load_functions()
+            function = self._functions.get(cmd_name)
+
+        if function is not None:
+            # Create commands on demand,
+            # so that running one function doesn't set up all the others
+            cmd = FunctionCommand(
+                function,
+                module_path=self.module_path,
+                output_file=self.output_file,
+                input_file=self.input_file,
+                concurrency=self.concurrency,
+                raw=self.raw,
             )
+            self.add_command(cmd)
+        elif self._functions:
+            suggestions = _close_matches(cmd_name, list(self._functions))
             if suggestions:
                 ctx.fail(
                     f"No such command: {cmd_name}\n"
@@ -416,9 +774,40 @@ class ModuleGroup(click.Group):
                 )
         return cmd
 
+    def _function_index(self) -> dict[str, str | None]:
+        """Get the names and descriptions of the module's functions, sorted by name.
+
+        Uses the on-disk index when it's fresh, so that listing functions doesn't
+        require importing the module. Otherwise, imports the module to find them
+        (which writes a new index).
+        """
+        if self._index is None:
+            index = read_function_index(self.module_path)
+            if index is None:
+                self._load_functions()
+            else:
+                self._index = dict(sorted(index.items()))
+        return self._index
+
     def list_commands(self, ctx: click.Context) -> list[str]:
-        self._load_commands()
-        return sorted(self.commands)
+        return list(self._function_index())
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        index = self._function_index()
+        if not index:
+            return
+
+        # Same layout as click.Group.format_commands,
+        # but without creating a command for each function
+        limit = formatter.width - 6 - max(len(name) for name in index)
+        rows = [
+            (name, make_default_short_help(description or "", limit).strip())
+            for name, description in index.items()
+        ]
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
 
 
 @click.command(
@@ -437,11 +826,23 @@ class ModuleGroup(click.Group):
     type=click.Path(writable=True),
     help="Write output to a JSON file",
 )
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    help="Number of inputs to process at once, for JSON Lines input only (default: 1)",
+)
+@click.option(
+    "--raw",
+    is_flag=True,
+    help="Write only function outputs to --output, without job details",
+)
 @click.argument("args", nargs=-1, type=click.UNPROCESSED)
 def run(
     module_path: str | None,
     output: str | None,
     input: str | None,
+    concurrency: int | None,
+    raw: bool,
     args: tuple[str, ...],
 ) -> None:
     """Run a function from a Python module.
@@ -457,6 +858,16 @@ def run(
 
         $ hype run example.py --input input.jsonl --output results.jsonl my_function
 
+    Use --concurrency to process several JSON Lines inputs at once
+    (in threads, so this helps most with functions that wait on I/O):
+
+        $ hype run example.py --input input.jsonl --concurrency 8 my_function
+
+    Output files hold each job's status, timestamps, and output.
+    Use --raw to write only the outputs:
+
+        $ hype run example.py --input input.jsonl --output results.jsonl --raw my_function
+
     When --output isn't specified, results are printed to stdout.
     """
     if module_path is None:
@@ -465,9 +876,7 @@ def run(
         ctx.exit()
 
     try:
-        module_dir = os.path.dirname(os.path.abspath(module_path))
-        if module_dir not in sys.path:
-            sys.path.insert(0, module_dir)
+        add_module_dir_to_path(module_path)
 
         if input is not None and len(args) > 1:  # args[0] is the command name
             # Check if any remaining args are function arguments
@@ -481,28 +890,28 @@ def run(
             module_path=module_path,
             input_file=input,
             output_file=output,
+            concurrency=concurrency,
+            raw=raw,
             name=os.path.basename(module_path),
             help="Available functions in this module.",
         )
 
-        if not args:
-            with click.Context(group) as ctx:
+        with click.Context(group) as ctx:
+            if not args:
                 click.echo(group.get_help(ctx))
-            return
+                return
 
-        ctx = click.Context(group)
-        cmd_name = args[0]
-        cmd = group.get_command(ctx, cmd_name)
-        if cmd is None:
-            raise click.ClickException(f"No such command: {cmd_name}")
+            cmd_name = args[0]
+            cmd = group.get_command(ctx, cmd_name)
+            if cmd is None:
+                raise click.ClickException(f"No such command: {cmd_name}")
 
-        remaining_args = list(args[1:])
-        if not remaining_args and not input:  # Only show help if no input file
-            with click.Context(cmd) as cmd_ctx:
-                click.echo(cmd.get_help(cmd_ctx))
-            return
+            remaining_args = args[1:]
+            if not remaining_args and not input:  # Only show help if no input file
+                with click.Context(cmd) as cmd_ctx:
+                    click.echo(cmd.get_help(cmd_ctx))
+                return
 
-        with ctx:
             return cmd.main(args=remaining_args, standalone_mode=False)
 
     except Exception as e:
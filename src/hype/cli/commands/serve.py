@@ -1,23 +1,26 @@
 import os
-import sys
+from typing import TYPE_CHECKING
 
 import click
-import uvicorn
-from fastapi import FastAPI
 
-from hype import create_fastapi_app
-from hype.cli.utils import find_functions, get_reload_dirs, import_module_from_path
+from hype.cli.utils import add_module_dir_to_path, get_reload_dirs, load_functions
 
+# FastAPI and uvicorn are imported when serving,
+# so that other commands don't pay for importing them
+if TYPE_CHECKING:
+    from fastapi import FastAPI
 
-def create_app() -> FastAPI:
+
+def create_app() -> "FastAPI":
     """Create the FastAPI application."""
+    from hype import create_fastapi_app  # pylint: disable=import-outside-toplevel
+
     click.echo("Loading module...")
     module_path = os.environ.get("HYPE_MODULE_PATH")
     if module_path is None:
         raise RuntimeError("HYPE_MODULE_PATH environment variable not set")
 
-    module = import_module_from_path(module_path)
-    functions = find_functions(module)
+    functions = load_functions(module_path)
 
     if not functions:
         raise click.ClickException(
@@ -61,13 +64,13 @@ def serve(
       # Start on custom port with auto-reload disabled
       hype serve path/to/module.py --port 8000 --no-reload
     """
+    import uvicorn  # pylint: disable=import-outside-toplevel
+
     try:
         if not os.path.isfile(module_path):
             raise click.ClickException(f"File not found: {module_path}")
 
-        module_dir = os.path.dirname(os.path.abspath(module_path))
-        if module_dir not in sys.path:
-            sys.path.insert(0, module_dir)
+        add_module_dir_to_path(module_path)
 
         os.environ["HYPE_MODULE_PATH"] = os.path.abspath(module_path)
 
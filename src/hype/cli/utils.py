@@ -1,11 +1,18 @@
+import hashlib
+import importlib.metadata
 import importlib.util
+import inspect
+import json
 import os
 import sys
-from typing import Any
+from collections.abc import Iterable
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
 import click
 
-from hype import Function
+if TYPE_CHECKING:
+    from hype import Function
 
 
 def import_module_from_path(path: str) -> Any:
@@ -23,14 +30,155 @@ def import_module_from_path(path: str) -> Any:
 
 def find_functions(module: Any) -> list:
     """Find all Function instances in a module."""
-    functions = []
-    for attr_name in dir(module):
-        attr = getattr(module, attr_name)
-        if isinstance(attr, Function):
-            functions.append(attr)
+    from hype.function import Function  # pylint: disable=import-outside-toplevel
+
+    return [attr for attr in vars(module).values() if isinstance(attr, Function)]
+
+
+def find_function_by_name(module: Any, name: str) -> "Function | None":
+    """Find the Function instance with a given name in a module.
+
+    Only checks the module attribute with that name,
+    so it won't find functions assigned to a different name.
+    """
+    from hype.function import Function  # pylint: disable=import-outside-toplevel
+
+    attr = getattr(module, name, None)
+    if isinstance(attr, Function) and attr.name == name:
+        return attr
+    return None
+
+
+_modules_cache: dict[tuple[str, int], Any] = {}
+_functions_cache: dict[tuple[str, int], list["Function"]] = {}
+
+
+def load_module(path: str) -> Any:
+    """Import a Python module from a file path.
+
+    Modules are cached until the file is modified.
+    """
+    path = os.path.abspath(path)
+    key = (path, os.stat(path).st_mtime_ns)
+    if (module := _modules_cache.get(key)) is None:
+        module = import_module_from_path(path)
+        _modules_cache[key] = module
+    return module
+
+
+def load_functions(path: str) -> list["Function"]:
+    """Import a Python module from a file path and find its Function instances.
+
+    Results are cached until the file is modified.
+    """
+    path = os.path.abspath(path)
+    key = (path, os.stat(path).st_mtime_ns)
+    if (functions := _functions_cache.get(key)) is None:
+        functions = find_functions(load_module(path))
+        _functions_cache[key] = functions
     return functions
 
 
+def get_cache_dir() -> str:
+    """Get the directory for hype's on-disk caches."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "hype")
+
+
+def _function_index_path(path: str) -> str:
+    digest = hashlib.sha256(os.path.abspath(path).encode()).hexdigest()
+    return os.path.join(get_cache_dir(), f"{digest}.json")
+
+
+@cache
+def _hype_version() -> str:
+    try:
+        return importlib.metadata.version("hype")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def read_function_index(path: str) -> dict[str, str | None] | None:
+    """Read the cached names and descriptions of a module's functions.
+
+    Returns None if there's no cache entry, or if the module,
+    any file defining one of its functions, or hype itself
+    changed since it was written.
+    """
+    try:
+        with open(_function_index_path(path)) as f:
+            entry = json.load(f)
+        if entry["version"] != _hype_version():
+            return None
+        for source, mtime_ns, size in entry["sources"]:
+            stat = os.stat(source)
+            if stat.st_mtime_ns != mtime_ns or stat.st_size != size:
+                return None
+        return {item["name"]: item["description"] for item in entry["functions"]}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def write_function_index(path: str, functions: Iterable["Function"]) -> None:
+    """Cache the names and descriptions of a module's functions.
+
+    The functions should be found in the imported module (with `find_functions`),
+    so that the index lists the same functions as importing the module would.
+    Along with the module, the index tracks each file that defines a function
+    (such as a helper module that the module re-exports),
+    so that changing any of them invalidates it.
+
+    The cache is an optimization, so failing to write it isn't an error.
+    """
+    try:
+        functions = sorted(functions, key=lambda function: function.name)
+        paths = {os.path.abspath(path)}
+        for function in functions:
+            wrapped = inspect.unwrap(function._wrapped)  # pylint: disable=protected-access
+            paths.add(os.path.abspath(inspect.getfile(wrapped)))
+
+        sources = []
+        for source in sorted(paths):
+            stat = os.stat(source)
+            sources.append([source, stat.st_mtime_ns, stat.st_size])
+
+        entry = {
+            "version": _hype_version(),
+            "sources": sources,
+            "functions": [
+                {"name": function.name, "description": function.description}
+                for function in functions
+            ],
+        }
+        index_path = _function_index_path(path)
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        # Write to a temporary file first so readers never see a partial entry
+        tmp_path = f"{index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, index_path)
+    except (OSError, TypeError):
+        # TypeError means a function's source file couldn't be found,
+        # so the index couldn't be invalidated when it changes
+        pass
+
+
+_module_dirs: set[str] = set()
+
+
+def add_module_dir_to_path(module_path: str) -> None:
+    """Make modules next to the given module importable.
+
+    Each directory is only checked against `sys.path` the first time it's seen.
+    """
+    module_dir = os.path.dirname(os.path.abspath(module_path))
+    if module_dir in _module_dirs:
+        return
+    _module_dirs.add(module_dir)
+    if module_dir not in sys.path:
+        sys.path.insert(0, module_dir)
+
+
 def get_reload_dirs(module_path: str) -> list[str]:
     """Get directories to watch for reload."""
     module_dir = os.path.dirname(os.path.abspath(module_path))
@@ -1,5 +1,6 @@
 import inspect
 from collections.abc import Callable, Mapping
+from functools import cached_property
 from typing import (
     Annotated,
     Any,
@@ -65,15 +66,15 @@ class Function(BaseModel, Generic[Parameters, Return]):
     def __call__(self, *args: Parameters.args, **kwargs: Parameters.kwargs) -> Return:  # pylint: disable=no-member
         return self._wrapped(*args, **kwargs)
 
-    @property
+    @cached_property
     def input_schema(self) -> dict[str, Any]:
         return self.input.model_json_schema()
 
-    @property
+    @cached_property
     def output_schema(self) -> dict[str, Any]:
         return self.output.model_json_schema()
 
-    @property
+    @cached_property
     def json_schema(self, title: str | None = None) -> JsonSchemaValue:
         _, top_level_schema = models_json_schema(
             [(self.input, "validation"), (self.output, "validation")],
@@ -1,3 +1,4 @@
+import copy
 import re
 from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING, Any, cast
@@ -33,7 +34,8 @@ class AnthropicTools(Tools[Result], Iterable["ToolParam"]):
             yield {
                 "name": function.name,
                 "description": function.description or "",
-                "input_schema": function.input.model_json_schema(mode="validation"),
+                # Copy the schema, so changes to the tool don't affect the function
+                "input_schema": copy.deepcopy(function.input_schema),
             }
 
     def __call__(self, tool_use: "ToolUseBlock") -> "ToolResultBlockParam":
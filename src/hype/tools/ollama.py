@@ -1,3 +1,4 @@
+import copy
 from collections.abc import Iterable, Iterator, Sequence
 from typing import TYPE_CHECKING, Any, Union, cast
 
@@ -14,7 +15,8 @@ class OllamaTools(Tools[Result], list, Sequence["Tool"]):
 
     def __iter__(self) -> Iterator["Tool"]:
         for function in self._tools.values():
-            parameters = function.input.model_json_schema(mode="validation")
+            # Copy the schema, so changes to the tool don't affect the function
+            parameters = copy.deepcopy(function.input_schema)
             yield {
                 "type": "function",
                 "function": {
@@ -21,10 +21,9 @@ class OpenAITools(Tools[Result], Iterable["ChatCompletionToolParam"]):
 
     def __iter__(self) -> Iterator["ChatCompletionToolParam"]:
         for function in self._tools.values():
-            parameters = function.input.model_json_schema(mode="validation")
-            parameters["additionalProperties"] = False
-
-            parameters = _process_parameters(parameters)
+            parameters = _process_parameters(
+                {**function.input_schema, "additionalProperties": False}
+            )
 
             yield {
                 "type": "function",
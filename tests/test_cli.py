@@ -1,15 +1,28 @@
 # pylint: disable=redefined-outer-name
 
+import importlib
 import json
+import os
 import threading
 import time
+from datetime import datetime, timezone
 
+import click
 import httpx
 import pytest
 from click.testing import CliRunner
-
-from hype.cli.commands.run import run
-from hype.cli.commands.serve import serve
+from pydantic import BaseModel
+
+from hype.cli import utils
+from hype.cli.commands.run import (
+    FunctionCommand,
+    ModuleGroup,
+    _dump_job,
+    _dump_value,
+    run,
+)
+from hype.cli.commands.serve import create_app, serve
+from hype.job import Error, Job
 
 
 @pytest.fixture
@@ -35,6 +48,13 @@ def runner():
     return CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep on-disk caches out of the user's home directory"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return tmp_path / "cache" / "hype"
+
+
 # Basic CLI argument tests
 def test_run_positional_args(runner, temp_module):
     result = runner.invoke(run, [temp_module, "add", "1", "2"])
@@ -126,6 +146,15 @@ def test_run_with_jsonl_input(runner, temp_module, tmp_path):
     assert json.loads(outputs[1])["output"] == 7  # 3 + 4
 
 
+def test_run_with_large_json_input(runner, temp_module, tmp_path):
+    input_file = tmp_path / "input.json"
+    message = "hello " * 20_000
+    input_file.write_text(json.dumps({"message": message}))
+    result = runner.invoke(run, [temp_module, "echo", "--input", str(input_file)])
+    assert result.exit_code == 0
+    assert result.output.strip() == message.strip()
+
+
 def test_run_empty_input_file(runner, temp_module, tmp_path):
     input_file = tmp_path / "empty.json"
     input_file.write_text("")
@@ -135,6 +164,14 @@ def test_run_empty_input_file(runner, temp_module, tmp_path):
     assert "Input file is empty" in result.output
 
 
+def test_run_large_blank_input_file(runner, temp_module, tmp_path):
+    input_file = tmp_path / "blank.json"
+    input_file.write_text(" \n" * 100_000)
+    result = runner.invoke(run, [temp_module, "add", "--input", str(input_file)])
+    assert result.exit_code != 0
+    assert "Input file is empty" in result.output
+
+
 def test_run_invalid_json_input(runner, temp_module, tmp_path):
     input_file = tmp_path / "invalid.json"
     input_file.write_text("{invalid json}")
@@ -188,6 +225,116 @@ def test_run_module_help(runner, temp_module):
     assert "echo" in result.output
 
 
+def test_run_module_help_uses_function_index(runner, temp_module, mocker):
+    run_module = importlib.import_module("hype.cli.commands.run")
+    spy = mocker.spy(run_module, "load_functions")
+
+    imported = runner.invoke(run, [temp_module])
+    assert imported.exit_code == 0
+    assert spy.call_count == 1
+
+    # The second listing is served from the on-disk index
+    cached = runner.invoke(run, [temp_module])
+    assert cached.exit_code == 0
+    assert cached.output == imported.output
+    assert spy.call_count == 1
+
+    # Modifying the module invalidates the index
+    with open(temp_module, "a") as f:
+        f.write("\n")
+    result = runner.invoke(run, [temp_module])
+    assert result.exit_code == 0
+    assert spy.call_count == 2
+
+
+def test_function_index_is_invalidated_by_hype_version(temp_module, monkeypatch):
+    (add,) = [f for f in utils.load_functions(temp_module) if f.name == "add"]
+    utils.write_function_index(temp_module, [add])
+    assert utils.read_function_index(temp_module) == {"add": add.description}
+
+    monkeypatch.setattr(utils, "_hype_version", lambda: "999.0.0")
+    assert utils.read_function_index(temp_module) is None
+
+
+def test_function_index_tracks_reexported_modules(runner, tmp_path):
+    helpers_path = tmp_path / "reexported_helpers.py"
+    helpers_path.write_text("""
+import hype
+
+@hype.up
+def alpha(x: int) -> int:
+    return x
+""")
+    module_path = tmp_path / "reexporting_module.py"
+    module_path.write_text("from reexported_helpers import *\n")
+
+    result = runner.invoke(run, [str(module_path)])
+    assert result.exit_code == 0
+    assert "alpha" in result.output
+    assert utils.read_function_index(str(module_path)) == {"alpha": None}
+
+    # Changing the helper module invalidates the index,
+    # even though the module itself didn't change
+    with open(helpers_path, "a") as f:
+        f.write("\n@hype.up\ndef beta(x: int) -> int:\n    return x\n")
+    assert utils.read_function_index(str(module_path)) is None
+
+
+def test_run_module_help_lists_all_functions(runner, tmp_path):
+    module_path = tmp_path / "mixed_module.py"
+    module_path.write_text("""
+import hype
+
+@hype.up
+def add(a: int, b: int) -> int:
+    \"\"\"Add two numbers\"\"\"
+    return a + b
+
+def multiply(a: int, b: int) -> int:
+    \"\"\"Multiply two numbers\"\"\"
+    return a * b
+
+multiply = hype.up(multiply)
+""")
+
+    listed = runner.invoke(run, [str(module_path)])
+    assert listed.exit_code == 0
+    assert "add" in listed.output
+    assert "multiply" in listed.output
+
+    # Listing is the same after running a command
+    result = runner.invoke(run, [str(module_path), "multiply", "2", "3"])
+    assert result.output == "6\n"
+    assert runner.invoke(run, [str(module_path)]).output == listed.output
+
+
+def test_run_model_output_to_stdout(runner, tmp_path):
+    module_path = tmp_path / "model_module.py"
+    module_path.write_text("""
+import hype
+from pydantic import BaseModel
+
+class Point(BaseModel):
+    x: int
+    y: int
+
+@hype.up
+def point(x: int, y: int) -> Point:
+    return Point(x=x, y=y)
+""")
+
+    result = runner.invoke(run, [str(module_path), "point", "1", "2"])
+    assert result.exit_code == 0
+    assert json.loads(result.output) == {"x": 1, "y": 2}
+
+
+def test_run_short_output_flag_after_args(runner, temp_module, tmp_path):
+    output_file = tmp_path / "output.json"
+    result = runner.invoke(run, [temp_module, "add", "1", "2", "-o", str(output_file)])
+    assert result.exit_code == 0
+    assert json.loads(output_file.read_text())["output"] == 3
+
+
 def test_run_with_json_array_input(runner, temp_module, tmp_path):
     input_file = tmp_path / "input.json"
     input_file.write_text(json.dumps([{"a": 1, "b": 2}, {"a": 3, "b": 4}]))
@@ -304,6 +451,14 @@ def test_batch_processing_jsonl(runner, temp_module, tmp_path):
     assert jobs[2]["output"] == 7
     assert jobs[2]["error"] is None
 
+    # Check that timestamps are ordered within each job
+    for job in jobs:
+        created_at, started_at, completed_at = (
+            datetime.fromisoformat(job[key].replace("Z", "+00:00"))
+            for key in ("created_at", "started_at", "completed_at")
+        )
+        assert created_at <= started_at <= completed_at
+
 
 def test_stdout_format(runner, temp_module):
     """Test that stdout format includes execution metadata."""
@@ -356,6 +511,149 @@ def test_serve(temp_module):
         server_thread.join(timeout=1)
 
 
+def test_function_command_reuses_options(temp_module):
+    (add,) = [f for f in utils.load_functions(temp_module) if f.name == "add"]
+
+    first = FunctionCommand(add, module_path=temp_module)
+    second = FunctionCommand(add, module_path=temp_module)
+    assert all(a is b for a, b in zip(first.params[2:], second.params[2:], strict=True))
+    assert [p.required for p in first.params[2:]] == [True, True, False]
+
+    # Parameters aren't required when reading from an input file
+    batch = FunctionCommand(add, module_path=temp_module, input_file="input.json")
+    assert not any(p.required for p in batch.params)
+
+
+def test_module_group_creates_commands_on_demand(temp_module, mocker):
+    spy = mocker.spy(utils, "find_functions")
+    group = ModuleGroup(module_path=temp_module)
+    ctx = click.Context(group)
+
+    command = group.get_command(ctx, "add")
+    assert isinstance(command, FunctionCommand)
+    assert list(group.commands) == ["add"]
+    assert group.get_command(ctx, "add") is command
+    assert spy.call_count == 0
+
+    # Unknown names fall back to finding all functions
+    assert group.get_command(ctx, "missing") is None
+    assert spy.call_count == 1
+
+
+def test_module_group_reuses_loaded_module(temp_module, mocker):
+    spy = mocker.spy(utils, "import_module_from_path")
+
+    for _ in range(2):
+        group = ModuleGroup(module_path=temp_module)
+        ctx = click.Context(group)
+        assert group.get_command(ctx, "add") is not None
+        assert group.list_commands(ctx) == ["add", "echo"]
+    assert spy.call_count == 1
+
+
+def test_dump_job_falls_back_to_str():
+    class Point:
+        def __str__(self):
+            return "(1, 2)"
+
+    assert json.loads(_dump_job(Job(input={}, output=[1, 2])))["output"] == [1, 2]
+    job = Job(
+        input={},
+        output=Point(),
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        started_at=datetime(2024, 1, 1, 0, 0, 1, 500, tzinfo=timezone.utc),
+    )
+    data = json.loads(_dump_job(job))
+    assert data["output"] == "(1, 2)"
+    # Timestamps have the same format as jobs that serialize normally
+    assert data["created_at"] == "2024-01-01T00:00:00Z"
+    assert data["started_at"] == "2024-01-01T00:00:01.000500Z"
+
+
+class Coordinates(BaseModel):
+    x: int
+    y: int
+
+
+@pytest.mark.parametrize(
+    "job",
+    [
+        Job(input={"a": 1}, output={"point": Coordinates(x=1, y=2)}),
+        Job(
+            input={},
+            error=Error(message="failed"),
+            started_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            completed_at=datetime(2024, 1, 1, 0, 0, 1, 500, tzinfo=timezone.utc),
+        ),
+    ],
+)
+def test_dump_job_matches_pydantic(job):
+    assert _dump_job(job) == job.model_dump_json().encode()
+
+
+def test_dump_value():
+    class Point:
+        def __str__(self):
+            return "(1, 2)"
+
+    assert json.loads(_dump_value({"point": Coordinates(x=1, y=2)})) == {
+        "point": {"x": 1, "y": 2}
+    }
+    assert json.loads(_dump_value([Point()])) == ["(1, 2)"]
+
+
+def test_dump_value_without_orjson(monkeypatch):
+    run_module = importlib.import_module("hype.cli.commands.run")
+    values = [
+        {"sum": 3, "items": [1, "two"]},
+        {"name": "café"},
+        {"at": datetime(2024, 1, 1, tzinfo=timezone.utc)},
+        [float("nan"), {"x": float("inf")}],
+    ]
+    expected = [_dump_value(value) for value in values]
+
+    monkeypatch.setattr(run_module, "orjson_dumps", None)
+    assert (
+        [_dump_value(value) for value in values]
+        == expected
+        == [
+            b'{"sum":3,"items":[1,"two"]}',
+            '{"name":"café"}'.encode(),
+            b'{"at":"2024-01-01T00:00:00Z"}',
+            b'[null,{"x":null}]',
+        ]
+    )
+
+
+def test_create_app_reuses_loaded_module(temp_module, monkeypatch, mocker):
+    monkeypatch.setenv("HYPE_MODULE_PATH", temp_module)
+    spy = mocker.spy(utils, "import_module_from_path")
+
+    create_app()
+    create_app()
+    assert spy.call_count == 1
+
+    # Modifying the module invalidates the cache
+    stat = os.stat(temp_module)
+    os.utime(temp_module, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    create_app()
+    assert spy.call_count == 2
+
+
+def test_run_with_jsonl_input_skips_blank_lines(runner, temp_module, tmp_path):
+    input_file = tmp_path / "input.jsonl"
+    input_file.write_text('\n{"a": 1, "b": 2}\r\n  \n{"a": 3, "b": 4}  \n\n')
+    output_file = tmp_path / "output.jsonl"
+
+    result = runner.invoke(
+        run,
+        [temp_module, "add", "--input", str(input_file), "--output", str(output_file)],
+    )
+    assert result.exit_code == 0
+    outputs = output_file.read_text().strip().split("\n")
+    assert [json.loads(output)["output"] for output in outputs] == [3, 7]
+
+
 def test_run_batch_with_progress_bar(runner, temp_module, tmp_path):
     """Test batch processing with a progress bar."""
     input_file = tmp_path / "input.jsonl"
@@ -383,6 +681,129 @@ def test_run_batch_with_progress_bar(runner, temp_module, tmp_path):
     assert json.loads(outputs[1])["output"] == 7  # 3 + 4
 
 
+def test_run_batch_to_stdout(runner, temp_module, tmp_path):
+    """Test that batch outputs are written to stdout one per line."""
+    input_file = tmp_path / "input.jsonl"
+    input_file.write_text("\n".join(json.dumps({"a": a, "b": 1}) for a in range(3)))
+
+    result = runner.invoke(run, [temp_module, "add", "--input", str(input_file)])
+    assert result.exit_code == 0
+    assert result.stdout.strip().splitlines()[-3:] == ["1", "2", "3"]
+
+
+def test_run_batch_to_stdout_keeps_errors_in_order(runner, tmp_path):
+    module_path = tmp_path / "divide_module.py"
+    module_path.write_text("""
+import hype
+
+@hype.up
+def divide(x: int, y: int) -> int:
+    return x // y
+""")
+    input_file = tmp_path / "input.jsonl"
+    input_file.write_text("\n".join(json.dumps({"x": 6, "y": y}) for y in [1, 0, 2]))
+
+    result = runner.invoke(
+        run, [str(module_path), "divide", "--input", str(input_file)]
+    )
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert lines[-3:] == ["6", "Error: integer division or modulo by zero", "3"]
+
+
+def test_run_concurrency_requires_jsonl_input(runner, temp_module, tmp_path):
+    input_file = tmp_path / "input.json"
+    input_file.write_text(json.dumps({"a": 1, "b": 2}))
+
+    for args in [
+        ["add", "1", "2"],
+        ["add", "--input", str(input_file)],
+    ]:
+        result = runner.invoke(run, [temp_module, "--concurrency", "2", *args])
+        assert result.exit_code != 0
+        assert "--concurrency only applies to JSON Lines" in result.output
+
+
+def test_run_batch_raw_output(runner, temp_module, tmp_path):
+    """Test that --raw writes only the outputs."""
+    input_file = tmp_path / "input.jsonl"
+    input_file.write_text("\n".join(json.dumps({"a": a, "b": 1}) for a in range(3)))
+    output_file = tmp_path / "output.jsonl"
+
+    result = runner.invoke(
+        run,
+        [
+            temp_module,
+            "--input",
+            str(input_file),
+            "--output",
+            str(output_file),
+            "--raw",
+            "add",
+        ],
+    )
+    assert result.exit_code == 0
+    assert output_file.read_text().splitlines() == ["1", "2", "3"]
+
+
+def test_run_batch_streams_jsonl_output(runner, temp_module, tmp_path):
+    """Test that each result is written before later inputs are read."""
+    input_file = tmp_path / "input.jsonl"
+    input_file.write_text(json.dumps({"a": 1, "b": 2}) + "\n{invalid\n")
+    output_file = tmp_path / "output.jsonl"
+
+    result = runner.invoke(
+        run,
+        [temp_module, "add", "--input", str(input_file), "--output", str(output_file)],
+    )
+    assert result.exit_code != 0
+    assert "Invalid JSON on line 2" in result.output
+
+    outputs = output_file.read_text().strip().split("\n")
+    assert len(outputs) == 1
+    assert json.loads(outputs[0])["output"] == 3
+
+
+def test_run_batch_with_concurrency(runner, tmp_path):
+    """Test that batch jobs run concurrently and are written in order."""
+    module_path = tmp_path / "barrier_module.py"
+    module_path.write_text("""
+import threading
+
+import hype
+
+# Only passes once two jobs are waiting at the same time
+barrier = threading.Barrier(2, timeout=5)
+
+@hype.up
+def wait(x: int) -> int:
+    barrier.wait()
+    return x
+""")
+    input_file = tmp_path / "input.jsonl"
+    input_file.write_text("\n".join(json.dumps({"x": x}) for x in range(4)))
+    output_file = tmp_path / "output.jsonl"
+
+    result = runner.invoke(
+        run,
+        [
+            str(module_path),
+            "--input",
+            str(input_file),
+            "--output",
+            str(output_file),
+            "--concurrency",
+            "2",
+            "wait",
+        ],
+    )
+    assert result.exit_code == 0
+
+    jobs = [json.loads(line) for line in output_file.read_text().splitlines()]
+    assert [job["output"] for job in jobs] == [0, 1, 2, 3]
+    assert all(job["status"] == "success" for job in jobs)
+
+
 # Parameterized tests for input and output flags
 @pytest.mark.parametrize(
     "input_flag, output_flag",
@@ -68,3 +68,21 @@ def test_function_docstring_description():
     assert input_props["y"]["description"] == "The second number (from field)"
 
     assert schema["$defs"]["Output"]["description"] == "The sum of the two numbers"
+
+
+def test_function_schemas_are_cached(mocker):
+    @hype.up
+    def g(x: int) -> int:
+        return x
+
+    spy = mocker.spy(g.input, "model_json_schema")
+
+    assert g.input_schema is g.input_schema
+    assert g.input_schema["properties"]["x"]["type"] == "integer"
+    assert spy.call_count == 1
+
+
+def test_lazy_imports_are_cached():
+    up = hype.up
+    assert vars(hype)["up"] is up
+    assert hype.Function is vars(hype)["Function"]
@@ -1,4 +1,5 @@
 import ast
+import copy
 import operator
 import re
 from collections.abc import Callable
@@ -97,3 +98,23 @@ def test_chat_with_claude():
     assert tools.future == [True]
 
     assert not response.content
+
+
+@pytest.mark.parametrize(
+    ("create_tools", "get_schema"),
+    [
+        (hype.create_anthropic_tools, lambda tool: tool["input_schema"]),
+        (hype.create_ollama_tools, lambda tool: tool["function"]["parameters"]),
+        (hype.create_openai_tools, lambda tool: tool["function"]["parameters"]),
+    ],
+)
+def test_tool_schema_is_a_copy(create_tools, get_schema):
+    original = copy.deepcopy(calculate.input_schema)
+
+    (tool,) = list(create_tools([calculate]))
+    schema = get_schema(tool)
+    schema["additionalProperties"] = False
+    schema.pop("title", None)
+    schema["properties"]["expression"]["type"] = "number"
+
+    assert calculate.input_schema == original